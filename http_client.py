@@ -0,0 +1,136 @@
+"""
+Shared HTTP Helpers
+===================
+Used by the practice files that call the same APIs over and over.
+
+- SESSION: one requests.Session, so connections are reused between calls
+- conditional_get(): a GET that skips re-downloading data that hasn't changed
+- json_loads() / json_dumps(): orjson when installed, the standard library otherwise
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(data):
+        """Return data as indented JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    import json
+
+    json_loads = json.loads
+
+    def json_dumps(data):
+        """Return data as indented JSON bytes."""
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+class _MenuRetry(Retry):
+    """
+    Retry tuned for the interactive scripts.
+
+    Logs retries caused by an error status, and never waits
+    longer than backoff_max, even if the server's Retry-After asks for more.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        # super() raises MaxRetryError once retries run out, so only real
+        # retries get logged here
+        new_retry = super().increment(method, url, response, error, *args, **kwargs)
+
+        # urllib3 already warns about connection errors and timeouts, but
+        # retries for a 429/5xx status are only logged at DEBUG level
+        if response is not None:
+            pool = kwargs.get("_pool")
+            if pool is not None:
+                port = "" if pool.port in (None, 80, 443) else f":{pool.port}"
+                url = f"{pool.scheme}://{pool.host}{port}{url}"
+            logging.warning(
+                f"Attempt {len(new_retry.history)} for {url} failed "
+                f"(HTTP {response.status}), retrying"
+            )
+        return new_retry
+
+
+# Pool sized for the concurrent fetches in part 5. Retries are handled by
+# urllib3 for idempotent requests (GET, not POST): the first retry is
+# immediate, then exponential backoff (0.6s, 1.2s) plus up to 0.3s of random
+# jitter so clients don't retry in lockstep. A server's Retry-After header is
+# honoured but capped at backoff_max, so the worst case is 3 retries x 3s = 9s.
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=_MenuRetry(
+        total=3,
+        backoff_factor=0.3,
+        backoff_jitter=0.3,
+        backoff_max=3,
+        status_forcelist=(429, 502, 503, 504),
+        respect_retry_after_header=True,
+        # Hand the last error response back so raise_for_status reports it
+        raise_on_status=False,
+    ),
+)
+
+SESSION = requests.Session()
+# All the APIs here answer in JSON. Compression is left to requests, which
+# sends Accept-Encoding: gzip, deflate (and br if `brotli` is installed).
+SESSION.headers["Accept"] = "application/json"
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# (url, params) -> (etag, last_modified, parsed JSON)
+_CONDITIONAL_CACHE = {}
+
+
+def conditional_get(url, params=None, timeout=10):
+    """
+    GET a JSON resource, reusing the last copy if the server says it's unchanged.
+
+    The ETag / Last-Modified headers from the previous response are sent back
+    as If-None-Match / If-Modified-Since. A 304 reply has no body, so the
+    stored data is returned instead of downloading it again.
+
+    Raises requests.RequestException on failure, just like SESSION.get.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    cached = _CONDITIONAL_CACHE.get(key)
+
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = SESSION.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        return cached[2]
+
+    response.raise_for_status()
+    data = response.json()
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _CONDITIONAL_CACHE[key] = (etag, last_modified, data)
+
+    return data
@@ -11,6 +11,10 @@ Learn:
 
 import requests
 
+# Shared session: the menu loop keeps calling the same hosts, so reuse the
+# pooled connections (retries are configured once in http_client.py).
+from http_client import SESSION, conditional_get
+
 
 def get_user_info():
     """Fetch user info based on user input."""
@@ -26,7 +30,7 @@ def get_user_info():
 
     url = f"https://jsonplaceholder.typicode.com/users/{user_id}"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
         print(f"\n--- User #{user_id} Info ---")
@@ -53,9 +57,7 @@ def search_posts():
     params = {"userId": user_id}
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        posts = response.json()
+        posts = conditional_get(url, params=params, timeout=5)
         if posts:
             print(f"\n--- Posts by User #{user_id} ---")
             for i, post in enumerate(posts, 1):
@@ -75,7 +77,7 @@ def get_crypto_price():
 
     url = f"https://api.coinpaprika.com/v1/tickers/{coin_id}"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
         price_usd = data['quotes']['USD']['price']
@@ -114,7 +116,7 @@ def get_weather():
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params, timeout=5)
         response.raise_for_status()
         data = response.json()
         weather = data["current_weather"]
@@ -138,9 +140,7 @@ def search_todos():
     params = {"completed": status}
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        todos = response.json()
+        todos = conditional_get(url, params=params, timeout=5)
         print(f"\nTotal todos found: {len(todos)}")
         for todo in todos[:5]:
             print("-", todo["title"])
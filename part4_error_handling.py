@@ -10,7 +10,6 @@ Learn:
 - Response validation
 """
 
-import time
 import requests
 import logging
 
@@ -25,50 +24,56 @@ from requests.exceptions import (
     HTTPError,
     RequestException
 )
-def safe_api_request(url, timeout=5, retries=3):
+
+# Retries live on the session's adapter (see http_client.py). Every failed
+# attempt is still logged as a warning before it is retried.
+from http_client import SESSION, json_loads
+
+
+def safe_api_request(url, timeout=5):
     """Make an API request with retry logic and logging."""
 
     logging.info(f"Request started: {url}")
 
-    for attempt in range(1, retries + 1):
-        try:
-            logging.info(f"Attempt {attempt} for {url}")
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-
-            logging.info(
-                f"Request successful ({response.status_code}) for {url}"
-            )
-            return {"success": True, "data": response.json()}
-
-        except (ConnectionError, Timeout) as e:
-            logging.warning(
-                f"Attempt {attempt} failed due to network issue: {e}"
-            )
-            if attempt == retries:
-                logging.error(
-                    f"Request failed after {retries} attempts: {url}"
-                )
-                return {
-                    "success": False,
-                    "error": f"Failed after {retries} attempts"
-                }
-            time.sleep(2)
-
-        except HTTPError as e:
-            status = e.response.status_code
-            logging.error(f"HTTP error {status} for {url}")
-            return {
-                "success": False,
-                "error": f"HTTP Error: {status}"
-            }
-
-        except RequestException as e:
-            logging.error(f"Request exception for {url}: {e}")
-            return {
-                "success": False,
-                "error": f"Request failed: {e}"
-            }
+    try:
+        response = SESSION.get(url, timeout=timeout)
+        response.raise_for_status()
+
+        logging.info(
+            f"Request successful ({response.status_code}) for {url}"
+        )
+        # Parse the raw bytes directly (orjson when available)
+        return {"success": True, "data": json_loads(response.content)}
+
+    except (ConnectionError, Timeout) as e:
+        retries = SESSION.get_adapter(url).max_retries.total
+        logging.error(f"Request failed after {retries} retries: {url} ({e})")
+        return {
+            "success": False,
+            "error": f"Failed after {retries} retries"
+        }
+
+    except HTTPError as e:
+        status = e.response.status_code
+        logging.error(f"HTTP error {status} for {url}")
+        return {
+            "success": False,
+            "error": f"HTTP Error: {status}"
+        }
+
+    except RequestException as e:
+        logging.error(f"Request exception for {url}: {e}")
+        return {
+            "success": False,
+            "error": f"Request failed: {e}"
+        }
+
+    except ValueError as e:
+        logging.error(f"Invalid JSON from {url}: {e}")
+        return {
+            "success": False,
+            "error": "Response is not valid JSON"
+        }
 
 
 def demo_error_handling():
@@ -90,18 +95,25 @@ def demo_error_handling():
         else:
             print(f"Failed: {result['error']}")
 
-def validate_crypto_response(data):
-    """Check if crypto response contains required fields."""
-    try:
-        if "quotes" not in data or "USD" not in data["quotes"]:
-            return False, "Missing quotes/USD data"
-        usd = data["quotes"]["USD"]
-        for field in ["price", "percent_change_24h"]:
-            if field not in usd:
-                return False, f"Missing field '{field}' in USD data"
-        return True, None
-    except TypeError:
-        return False, "Invalid response format"
+def extract_usd(data):
+    """
+    Validate a crypto response and return its USD quote.
+
+    Returns (usd, None) on success or (None, error message) if the
+    response is missing required fields.
+    """
+    if not isinstance(data, dict):
+        return None, "Invalid response format"
+    quotes = data.get("quotes")
+    if not isinstance(quotes, dict):
+        return None, "Missing quotes/USD data"
+    usd = quotes.get("USD")
+    if not isinstance(usd, dict):
+        return None, "Missing quotes/USD data"
+    for field in ["price", "percent_change_24h"]:
+        if field not in usd:
+            return None, f"Missing field '{field}' in USD data"
+    return usd, None
 
 
 def fetch_crypto_safely():
@@ -124,15 +136,12 @@ def fetch_crypto_safely():
 
     data = result["data"]
 
-    # ✅ VALIDATION STEP
-    is_valid, error = validate_crypto_response(data)
-    if not is_valid:
+    # ✅ VALIDATION STEP (also hands back the USD quote for safe access)
+    usd, error = extract_usd(data)
+    if usd is None:
         print(f"\nInvalid crypto data: {error}")
         return
 
-    # ✅ SAFE ACCESS
-    usd = data["quotes"]["USD"]
-
     print(f"\n{data['name']} ({data['symbol']})")
     print(f"Price: ${usd['price']:,.2f}")
     print(f"24h Change: {usd['percent_change_24h']:+.2f}%")
@@ -9,9 +9,14 @@ Learn:
 - Building a simple CLI dashboard
 - Using environment variables for API keys (optional)
 """
-import json
+import asyncio
+import time
 import requests
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from http_client import SESSION, conditional_get, json_dumps
 
 import os
 
@@ -54,19 +59,52 @@ CRYPTO_IDS = {
     "ripple": "xrp-xrp",
 }
 
+# Lookup tables keyed by casefolded name, built once at import
+_CITY_KEYS = {name.casefold(): coords for name, coords in CITIES.items()}
+_CRYPTO_KEYS = {name.casefold(): coin_id for name, coin_id in CRYPTO_IDS.items()}
+
+# Weather condition codes (Open-Meteo / WMO)
+WEATHER_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Foggy", 48: "Depositing rime fog",
+    51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
+    95: "Thunderstorm",
+}
 
-def get_weather(city_name):
-    """
-    Fetch weather data using Open-Meteo API (FREE, no API key needed).
-    """
-    city_lower = city_name.lower().strip()
+# Codes are small ints, so a list indexed by code avoids hashing on lookup
+WEATHER_CODE_TABLE = [
+    WEATHER_CODES.get(code, "Unknown") for code in range(max(WEATHER_CODES) + 1)
+]
+
+# Separator lines used by the display functions, built once
+SEP40 = "=" * 40
+SEP50 = "=" * 50
+SEP55 = "=" * 55
+DASH50 = "-" * 50
+DASH55 = "-" * 55
+
+# Table row templates, parsed once and reused inside the display loops
+_CRYPTO_ROW = "{:<15}${:>14,.2f}{:>14.2f}%".format
+_CRYPTO_TEXT_ROW = "{:<15}{:>15}{:>15}".format
+_TOP_CRYPTO_HEADER = f"  {'Rank':<6}{'Name':<15}{'Price':<15}{'24h Change'}"
+_TOP_CRYPTO_ROW = "  {:<6}{:<15}${:>12,.2f}  {:+.2f}%".format
+
+# Seconds a fetched result is reused before asking the API again
+CACHE_TTL = 60
 
-    if city_lower not in CITIES:
-        print(f"\nCity '{city_name}' not found.")
-        print(f"Available cities: {', '.join(CITIES.keys())}")
-        return None
 
-    lat, lon = CITIES[city_lower]
+def _cache_bucket():
+    """Return a value that changes every CACHE_TTL seconds (used as a cache key)."""
+    return int(time.monotonic() // CACHE_TTL)
+
+
+@lru_cache(maxsize=128)
+def _cached_weather(coords, bucket):
+    """Fetch Open-Meteo data for (lat, lon) coords. Errors are raised, not cached."""
+    lat, lon = coords
 
     url = "https://api.open-meteo.com/v1/forecast"
     params = {
@@ -77,10 +115,24 @@ def get_weather(city_name):
         "timezone": "auto"
     }
 
+    response = SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_weather(city_name):
+    """
+    Fetch weather data using Open-Meteo API (FREE, no API key needed).
+    """
+    coords = _CITY_KEYS.get(city_name.strip().casefold())
+
+    if coords is None:
+        print(f"\nCity '{city_name}' not found.")
+        print(f"Available cities: {', '.join(CITIES.keys())}")
+        return None
+
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_weather(coords, _cache_bucket())
     except requests.RequestException as e:
         print(f"Error fetching weather: {e}")
         return None
@@ -96,8 +148,10 @@ def save_to_json(data, filename="results.json"):
         return
 
     try:
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+        # Encode first so a serialization error can't leave a half-written file
+        content = json_dumps(data)
+        with open(filename, "wb") as f:
+            f.write(content)
         print(f"\nData successfully saved to '{filename}'")
     except Exception as e:
         print(f"Failed to save data: {e}")
@@ -119,43 +173,39 @@ def get_openweather(city_name):
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
         print(f"Error fetching OpenWeatherMap data: {e}")
         return None
-def display_weather(city_name):
+def display_weather(city_name: str) -> None:
     """Display formatted weather information."""
-    data = get_weather(city_name)
+    render_weather(city_name, get_weather(city_name))
 
+
+def render_weather(city_name: str, data: Optional[dict]) -> None:
+    """Print weather data already fetched by get_weather."""
     if not data:
         return
 
     current = data["current_weather"]
 
-    print(f"\n{'=' * 40}")
+    print(f"\n{SEP40}")
     print(f"  Weather in {city_name.title()}")
-    print(f"{'=' * 40}")
+    print(SEP40)
     print(f"  Temperature: {current['temperature']}°C")
     print(f"  Wind Speed: {current['windspeed']} km/h")
     print(f"  Wind Direction: {current['winddirection']}°")
 
-    # Weather condition codes
-    weather_codes = {
-        0: "Clear sky",
-        1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-        45: "Foggy", 48: "Depositing rime fog",
-        51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-        61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-        71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
-        95: "Thunderstorm",
-    }
-
     code = current.get("weathercode", 0)
-    condition = weather_codes.get(code, "Unknown")
+    if isinstance(code, int) and 0 <= code < len(WEATHER_CODE_TABLE):
+        condition = WEATHER_CODE_TABLE[code]
+    else:
+        # null, float or out-of-range codes
+        condition = WEATHER_CODES.get(code, "Unknown")
     print(f"  Condition: {condition}")
-    print(f"{'=' * 40}")
+    print(SEP40)
 
 def display_openweather(city_name):
     """Display OpenWeatherMap weather information."""
@@ -168,66 +218,100 @@ def display_openweather(city_name):
     weather_list = data.get("weather", [])
     condition = weather_list[0]["description"] if weather_list else "Unknown"
 
-    print(f"\n{'='*40}")
+    print(f"\n{SEP40}")
     print(f"  OpenWeatherMap Weather in {city_name.title()}")
-    print(f"{'='*40}")
+    print(SEP40)
     print(f"  Temperature: {main.get('temp', 'N/A')}°C")
     print(f"  Humidity: {main.get('humidity', 'N/A')}%")
     print(f"  Wind Speed: {wind.get('speed', 'N/A')} m/s")
     print(f"  Condition: {condition.title()}")
-    print(f"{'='*40}")
+    print(SEP40)
+
+@lru_cache(maxsize=128)
+def _cached_crypto(coin_id, bucket):
+    """Fetch a CoinPaprika ticker. Errors are raised, not cached."""
+    url = f"https://api.coinpaprika.com/v1/tickers/{coin_id}"
+
+    response = SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def _coin_id(coin_name):
+    """Map a common coin name to its CoinPaprika ID (unknown names pass through)."""
+    coin_key = coin_name.strip().casefold()
+    return _CRYPTO_KEYS.get(coin_key, coin_key)
+
 
 def get_crypto_price(coin_name):
     """
     Fetch crypto data using CoinPaprika API (FREE, no API key needed).
     """
-    coin_lower = coin_name.lower().strip()
-
-    # Map common name to API ID
-    coin_id = CRYPTO_IDS.get(coin_lower, coin_lower)
-
-    url = f"https://api.coinpaprika.com/v1/tickers/{coin_id}"
+    coin_id = _coin_id(coin_name)
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_crypto(coin_id, _cache_bucket())
     except requests.RequestException as e:
         print(f"Error fetching crypto data: {e}")
         return None
-def compare_cryptos(coin_list):
+async def fetch_cryptos(coin_list):
+    """
+    Fetch several coins at once instead of one after another.
+
+    Each get_crypto_price call runs in a worker thread, so the total wait
+    is roughly the slowest request rather than the sum of all of them.
+    Results come back in the same order as coin_list.
+    """
+    # Fetch each coin only once: parallel threads for the same coin would
+    # all miss the cache and each make their own request
+    unique = {}
+    for coin in coin_list:
+        unique.setdefault(_coin_id(coin), coin)
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(get_crypto_price, coin) for coin in unique.values())
+    )
+    by_id = dict(zip(unique, results))
+    return [by_id[_coin_id(coin)] for coin in coin_list]
+
+
+def compare_cryptos(coin_list: list[str]) -> None:
     """
     Compare multiple cryptocurrencies and display their prices and 24h changes.
     
     coin_list: list of coin names or symbols (e.g., ['bitcoin', 'ethereum'])
     """
-    print(f"\n{'='*55}")
+    results = asyncio.run(fetch_cryptos(coin_list))
+
+    print(f"\n{SEP55}")
     print("   Crypto Price Comparison")
-    print(f"{'='*55}")
-    print(f"{'Coin':<15}{'Price USD':>15}{'24h Change':>15}")
-    print(f"{'-'*55}")
+    print(SEP55)
+    print(_CRYPTO_TEXT_ROW("Coin", "Price USD", "24h Change"))
+    print(DASH55)
 
-    for coin in coin_list:
-        data = get_crypto_price(coin)  # reuse your existing function
+    for coin, data in zip(coin_list, results):
         if data is None:
-            print(f"{coin:<15}{'N/A':>15}{'N/A':>15}")
+            print(_CRYPTO_TEXT_ROW(coin, "N/A", "N/A"))
             continue
 
         try:
             usd = data["quotes"]["USD"]
             price = usd["price"]
             change_24h = usd["percent_change_24h"]
-            print(f"{data['symbol']:<15}${price:>14,.2f}{change_24h:>14.2f}%")
+            print(_CRYPTO_ROW(data["symbol"], price, change_24h))
         except KeyError:
-            print(f"{coin:<15}{'Error':>15}{'Error':>15}")
+            print(_CRYPTO_TEXT_ROW(coin, "Error", "Error"))
 
-    print(f"{'='*55}")
+    print(SEP55)
 
 
-def display_crypto(coin_name):
+def display_crypto(coin_name: str) -> None:
     """Display formatted crypto information."""
-    data = get_crypto_price(coin_name)
+    render_crypto(coin_name, get_crypto_price(coin_name))
+
 
+def render_crypto(coin_name: str, data: Optional[dict]) -> None:
+    """Print crypto data already fetched by get_crypto_price."""
     if not data:
         print(f"\nCoin '{coin_name}' not found.")
         print(f"Available: {', '.join(CRYPTO_IDS.keys())}")
@@ -235,9 +319,9 @@ def display_crypto(coin_name):
 
     usd = data["quotes"]["USD"]
 
-    print(f"\n{'=' * 40}")
+    print(f"\n{SEP40}")
     print(f"  {data['name']} ({data['symbol']})")
-    print(f"{'=' * 40}")
+    print(SEP40)
     print(f"  Price: ${usd['price']:,.2f}")
     print(f"  Market Cap: ${usd['market_cap']:,.0f}")
     print(f"  24h Volume: ${usd['volume_24h']:,.0f}")
@@ -245,18 +329,22 @@ def display_crypto(coin_name):
     print(f"  1h Change:  {usd['percent_change_1h']:+.2f}%")
     print(f"  24h Change: {usd['percent_change_24h']:+.2f}%")
     print(f"  7d Change:  {usd['percent_change_7d']:+.2f}%")
-    print(f"{'=' * 40}")
+    print(SEP40)
 
 
-def get_top_cryptos(limit=5):
-    """Fetch top cryptocurrencies by market cap."""
+@lru_cache(maxsize=128)
+def _cached_top_cryptos(limit, bucket):
+    """Fetch the top CoinPaprika tickers. Errors are raised, not cached."""
     url = "https://api.coinpaprika.com/v1/tickers"
     params = {"limit": limit}
 
+    return conditional_get(url, params=params, timeout=10)
+
+
+def get_top_cryptos(limit=5):
+    """Fetch top cryptocurrencies by market cap."""
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_top_cryptos(limit, _cache_bucket())
     except requests.RequestException as e:
         print(f"Error: {e}")
         return None
@@ -278,7 +366,7 @@ def create_post():
     payload = {"title": title, "body": body}
 
     try:
-        response = requests.post(url, json=payload, timeout=5)
+        response = SESSION.post(url, json=payload, timeout=5)
         response.raise_for_status()  # Raise error for bad status codes
         data = response.json()
         last_post_data = data
@@ -289,35 +377,44 @@ def create_post():
     except requests.RequestException as e:
         print(f"Failed to create post: {e}")
 
-def display_top_cryptos():
+def display_top_cryptos() -> None:
     """Display top 5 cryptocurrencies."""
     data = get_top_cryptos(5)
 
     if not data:
         return
 
-    print(f"\n{'=' * 55}")
+    print(f"\n{SEP55}")
     print(f"  Top 5 Cryptocurrencies by Market Cap")
-    print(f"{'=' * 55}")
-    print(f"  {'Rank':<6}{'Name':<15}{'Price':<15}{'24h Change'}")
-    print(f"  {'-' * 50}")
+    print(SEP55)
+    print(_TOP_CRYPTO_HEADER)
+    print(f"  {DASH50}")
 
     for coin in data:
         usd = coin["quotes"]["USD"]
-        change = usd["percent_change_24h"]
-        change_str = f"{change:+.2f}%"
+        print(_TOP_CRYPTO_ROW(
+            coin["rank"], coin["name"], usd["price"], usd["percent_change_24h"]
+        ))
+
+    print(SEP55)
 
-        print(f"  {coin['rank']:<6}{coin['name']:<15}${usd['price']:>12,.2f}  {change_str}")
 
-    print(f"{'=' * 55}")
+async def quick_dashboard(city="delhi", coin="bitcoin"):
+    """Fetch weather and crypto together (different hosts), then print both."""
+    weather, crypto = await asyncio.gather(
+        asyncio.to_thread(get_weather, city),
+        asyncio.to_thread(get_crypto_price, coin),
+    )
+    render_weather(city, weather)
+    render_crypto(coin, crypto)
 
 
 def dashboard():
     """Interactive dashboard combining weather and crypto."""
-    print("\n" + "=" * 50)
+    print(f"\n{SEP50}")
     print("   Real-World API Dashboard")
     print(f"   {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 50)
+    print(SEP50)
 
     while True:
         print("\nOptions:")
@@ -347,8 +444,7 @@ def dashboard():
             display_top_cryptos()
 
         elif choice == "4":
-            display_weather("delhi")
-            display_crypto("bitcoin")
+            asyncio.run(quick_dashboard())
 
         elif choice == "5":
             print(f"\nAvailable cryptos: {', '.join(CRYPTO_IDS.keys())}")